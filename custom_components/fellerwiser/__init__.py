@@ -3,20 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 
-from .main import establish_websocket
+from .const import DOMAIN, REQUEST_TIMEOUT_SECONDS
+from .coordinator import FellerHvacGroupsCoordinator, FellerLoadsCoordinator
+from .feller_client import FellerApiClient
+from .main import WebsocketState, establish_websocket
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=5)
-
-
 PLATFORMS: list[Platform] = [Platform.COVER, Platform.LIGHT, Platform.CLIMATE]
 
 
@@ -24,16 +24,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Feller Wiser from a config entry."""
     host = entry.data["host"]
     apikey = entry.data["apikey"]
+
+    client = FellerApiClient(host, apikey, REQUEST_TIMEOUT_SECONDS)
+    loads_coordinator = FellerLoadsCoordinator(hass, client)
+    hvac_coordinator = FellerHvacGroupsCoordinator(hass, client)
+    try:
+        await loads_coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        await client.close()
+        raise
+
+    websocket = WebsocketState()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "client": client,
+        "loads_coordinator": loads_coordinator,
+        "hvac_coordinator": hvac_coordinator,
+        "websocket": websocket,
+    }
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    _LOGGER.info("----------------------blubb-------------------------")
-    asyncio.get_event_loop().create_task(establish_websocket(host, apikey))
+    ws_task = entry.async_create_background_task(
+        hass,
+        establish_websocket(host, apikey, websocket),
+        name="fellerwiser_websocket",
+    )
+    hass.data[DOMAIN][entry.entry_id]["ws_task"] = ws_task
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    for platform in PLATFORMS:
-        await hass.config_entries.async_forward_entry_unload(entry, platform)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    return True
+    if unload_ok:
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        ws_task: asyncio.Task = data["ws_task"]
+        ws_task.cancel()
+        await asyncio.gather(ws_task, return_exceptions=True)
+        await data["client"].close()
+
+    return unload_ok
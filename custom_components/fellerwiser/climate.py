@@ -12,36 +12,51 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import callback
+from homeassistant.exceptions import PlatformNotReady
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import REQUEST_TIMEOUT_SECONDS
+from .const import DOMAIN
+from .coordinator import FellerHvacGroupsCoordinator
 from .feller_client import FellerApiClient
-from .main import WISER_ENTITIES
+from .main import WebsocketState
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up all the Feller Climate Entities."""
-    host = entry.data["host"]
-    apikey = entry.data["apikey"]
+    data = hass.data[DOMAIN][entry.entry_id]
+    client: FellerApiClient = data["client"]
+    coordinator: FellerHvacGroupsCoordinator = data["hvac_coordinator"]
+    websocket: WebsocketState = data["websocket"]
 
-    client = FellerApiClient(host, apikey, REQUEST_TIMEOUT_SECONDS)
-    result = await client.get_all_hvac_groups_async()
+    # hvac groups are fetched here so a failure only affects the climate platform
+    await coordinator.async_refresh()
+    if not coordinator.last_update_success:
+        raise PlatformNotReady from coordinator.last_exception
 
     climate_entities = []
-    for group in result.data:
-        climate_entities.append(FellerHvacGroup(group, client))
-
-    WISER_ENTITIES.extend(climate_entities)
+    for group in coordinator.data.values():
+        climate_entities.append(
+            FellerHvacGroup(coordinator, group, client, websocket)
+        )
 
-    async_add_entities(climate_entities, True)
+    async_add_entities(climate_entities)
 
 
-class FellerHvacGroup(ClimateEntity):
+class FellerHvacGroup(CoordinatorEntity[FellerHvacGroupsCoordinator], ClimateEntity):
     """Representation of an Feller Climate Controller Channel."""
 
-    def __init__(self, group: dict, client: FellerApiClient) -> None:
+    def __init__(
+        self,
+        coordinator: FellerHvacGroupsCoordinator,
+        group: dict,
+        client: FellerApiClient,
+        websocket: WebsocketState,
+    ) -> None:
         """Initialize an Feller Hvac Group."""
+        super().__init__(coordinator)
         self._name: str = group["name"]
         self._id: str = str(group["id"])
         self._wiser_id: int = group["id"]
@@ -54,15 +69,20 @@ class FellerHvacGroup(ClimateEntity):
             | ClimateEntityFeature.TURN_ON
         )
         self._client: FellerApiClient = client
+        self._websocket = websocket
         self._current_temperature: float | None = None
         self._target_temperature: float | None = None
         self._hvac_mode: HVACMode | None = None
         self._hvac_action: HVACAction | None = None
         self._min_temp: float | None = None
         self._max_temp: float | None = None
+        self._last_available: bool | None = None
         self._hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
         self._temp_mode = UnitOfTemperature.CELSIUS
 
+        if "state" in group:
+            self._update_from_group(group)
+
     @property
     def name(self) -> str:
         """Return the display name of this light."""
@@ -72,16 +92,26 @@ class FellerHvacGroup(ClimateEntity):
     def wiser_entity_id(self):
         return self._wiser_id
 
+    @property
+    def available(self) -> bool:
+        """Available while the websocket is connected or the last resync succeeded."""
+        return self._websocket.connected or super().available
+
+    async def async_added_to_hass(self) -> None:
+        """Start receiving websocket updates once the entity is added."""
+        await super().async_added_to_hass()
+        self._websocket.hvac_entities[self._wiser_id] = self
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop receiving websocket updates once the entity is removed."""
+        await super().async_will_remove_from_hass()
+        self._websocket.hvac_entities.pop(self._wiser_id, None)
+
     @property
     def current_temperature(self):
         """Return the current temperature."""
         return self._current_temperature
 
-    @property
-    def should_poll(self):
-        """Return the polling state."""
-        return False
-
     @property
     def target_temperature(self):
         """Return the target temperature."""
@@ -118,6 +148,7 @@ class FellerHvacGroup(ClimateEntity):
         await self._client.set_hvac_group_temperature_async(
             group_id=self._wiser_id, target_temperature=target_temperature
         )
+        self._target_temperature = target_temperature
         self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
@@ -145,32 +176,48 @@ class FellerHvacGroup(ClimateEntity):
         self._hvac_mode = HVACMode.OFF
         self.async_write_ha_state()
 
-    async def async_update(self):
-        """Update the state of the hvac group."""
-        result = await self._client.get_hvac_group_async(self._wiser_id)
-        self._update_from_state(result.data["state"])
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the state of the hvac group from the latest coordinator data."""
+        group = self.coordinator.data.get(self._wiser_id)
 
-        self._min_temp = result.data["min_temperature"]
-        self._max_temp = result.data["max_temperature"]
+        old_state = self._state_snapshot()
+        self._last_available = self.available
+        if group is not None and "state" in group:
+            self._update_from_group(group)
 
-    def update_from_websocket_message(self, message):
-        if "hvacgroup" not in message:
-            _LOGGER.debug(
-                "No hvacgroup in websocket message, skipping update of hvacgroup with id %s",
-                self._id,
-            )
+        if old_state == self._state_snapshot():
             return
 
-        message = message["hvacgroup"]
+        self.async_write_ha_state()
+
+    def _apply_state(self, state: dict | None) -> None:
+        old_state = self._state_snapshot()
+        self._last_available = self.available
+        if state is not None:
+            self._update_from_state(state)
 
-        if "state" not in message:
-            _LOGGER.debug(
-                "No state in websocket message, skipping update of cover with id %s",
-                self._id,
-            )
+        if old_state == self._state_snapshot():
             return
-        self._update_from_state(message["state"])
-        self.schedule_update_ha_state()
+
+        self.async_write_ha_state()
+
+    def _state_snapshot(self) -> tuple:
+        return (
+            self._last_available,
+            self._min_temp,
+            self._max_temp,
+            self._hvac_mode,
+            self._target_temperature,
+            self._current_temperature,
+            self._hvac_action,
+        )
+
+    def _update_from_group(self, group: dict):
+        self._update_from_state(group["state"])
+
+        self._min_temp = group["min_temperature"]
+        self._max_temp = group["max_temperature"]
 
     def _update_from_state(self, state: dict):
         self._current_temperature = state["ambient_temperature"]
@@ -1,4 +1,8 @@
 """Constants for the Feller Wiser integration."""
 
+from datetime import timedelta
+
 DOMAIN = "fellerwiser"
 REQUEST_TIMEOUT_SECONDS = 10
+# State is pushed over the websocket, polling only resyncs missed updates.
+RESYNC_INTERVAL = timedelta(minutes=5)
@@ -0,0 +1,57 @@
+"""Data update coordinators for the Feller Wiser integration."""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import RESYNC_INTERVAL
+from .feller_client import FellerApiClient, FellerApiException
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FellerLoadsCoordinator(DataUpdateCoordinator[dict[int, dict]]):
+    """Fetches all loads from the Wiser API with a single request."""
+
+    def __init__(self, hass: HomeAssistant, client: FellerApiClient) -> None:
+        """Coordinator initialization."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="Feller Wiser loads",
+            update_interval=RESYNC_INTERVAL,
+        )
+        self._client = client
+
+    async def _async_update_data(self) -> dict[int, dict]:
+        """Fetch all loads, keyed by their wiser id."""
+        try:
+            result = await self._client.get_all_loads_async()
+        except FellerApiException as e:
+            raise UpdateFailed(e) from e
+        return {load["id"]: load for load in result.data}
+
+
+class FellerHvacGroupsCoordinator(DataUpdateCoordinator[dict[int, dict]]):
+    """Fetches all hvac groups from the Wiser API with a single request."""
+
+    def __init__(self, hass: HomeAssistant, client: FellerApiClient) -> None:
+        """Coordinator initialization."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="Feller Wiser hvac groups",
+            update_interval=RESYNC_INTERVAL,
+        )
+        self._client = client
+
+    async def _async_update_data(self) -> dict[int, dict]:
+        """Fetch all hvac groups, keyed by their wiser id."""
+        try:
+            result = await self._client.get_all_hvac_groups_async()
+        except FellerApiException as e:
+            raise UpdateFailed(e) from e
+        return {group["id"]: group for group in result.data}
@@ -7,54 +7,68 @@ from typing import Any
 
 from homeassistant.components.cover import ATTR_POSITION, CoverEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import REQUEST_TIMEOUT_SECONDS
+from .const import DOMAIN
+from .coordinator import FellerLoadsCoordinator
 from .feller_client import FellerApiClient
-from .main import WISER_ENTITIES
+from .main import WebsocketState
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _level_to_position(level: int) -> float:
+    """Convert a wiser cover level to a home assistant cover position."""
+    # ha: 100 = open, 0 = closed
+    # feller: 10000 = closed, 0 = open
+    return 100 - (level / 100)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
     """Set up all the Feller Climate Entities."""
-    host = entry.data["host"]
-    apikey = entry.data["apikey"]
-
-    client = FellerApiClient(host, apikey, REQUEST_TIMEOUT_SECONDS)
-    result = await client.get_all_loads_async()
+    data = hass.data[DOMAIN][entry.entry_id]
+    client: FellerApiClient = data["client"]
+    coordinator: FellerLoadsCoordinator = data["loads_coordinator"]
+    websocket: WebsocketState = data["websocket"]
 
     cover_entries = []
-    for value in result.data:
+    for value in coordinator.data.values():
         if value["type"] == "motor":
             if value["unused"]:
                 continue
-            cover_entries.append(FellerCover(value, client))
-
-    WISER_ENTITIES.extend(cover_entries)
+            cover_entries.append(
+                FellerCover(coordinator, value, client, websocket)
+            )
 
-    async_add_entities(cover_entries, True)
+    async_add_entities(cover_entries)
 
 
-class FellerCover(CoverEntity):
+class FellerCover(CoordinatorEntity[FellerLoadsCoordinator], CoverEntity):
     """Represents an Feller Cover."""
 
-    def __init__(self, data, client: FellerApiClient) -> None:
+    def __init__(
+        self,
+        coordinator: FellerLoadsCoordinator,
+        data,
+        client: FellerApiClient,
+        websocket: WebsocketState,
+    ) -> None:
         """Initialize an Feller Cover."""
-        self._state = None
-        self._data = data
+        super().__init__(coordinator)
         self._name = data["name"]
         self._id = str(data["id"])
         self._wiser_id = data["id"]
-        self._is_opening = False
-        self._is_closing = False
-        self._is_opened = False
-        self._is_closed = False
-        self._is_partially_opened = False
         self._position = None
+        self._moving = "stop"
+        self._last_available: bool | None = None
         self._client: FellerApiClient = client
+        self._websocket = websocket
+
+        if "state" in data:
+            self._update_from_state(data["state"])
 
     @property
     def name(self) -> str:
@@ -68,136 +82,97 @@ class FellerCover(CoverEntity):
     def wiser_entity_id(self):
         return self._wiser_id
 
+    @property
+    def available(self) -> bool:
+        """Available while the websocket is connected or the last resync succeeded."""
+        return self._websocket.connected or super().available
+
+    async def async_added_to_hass(self) -> None:
+        """Start receiving websocket updates once the entity is added."""
+        await super().async_added_to_hass()
+        self._websocket.load_entities[self._wiser_id] = self
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop receiving websocket updates once the entity is removed."""
+        await super().async_will_remove_from_hass()
+        self._websocket.load_entities.pop(self._wiser_id, None)
+
     @property
     def current_cover_position(self):
         return self._position
 
     @property
     def is_opening(self) -> bool | None:
-        return self._is_opening
+        return self._moving == "up"
 
     @property
     def is_closing(self) -> bool | None:
-        return self._is_closing
+        return self._moving == "down"
 
     @property
     def is_opened(self) -> bool | None:
-        return self._is_opened
+        if self._position is None:
+            return None
+        return self._position >= 100
 
     @property
     def is_closed(self) -> bool | None:
-        return self._is_closed
+        if self._position is None:
+            return None
+        return self._position <= 0
 
     @property
     def is_partially_opened(self) -> bool | None:
-        return self._is_partially_opened
-
-    @property
-    def should_poll(self) -> bool | None:
-        return False
+        if self._position is None:
+            return None
+        return 0 < self._position < 100
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
-        self._position = kwargs.get(ATTR_POSITION, 100)
-        result = await self._client.set_cover_level_async(self._wiser_id, 0)
-        self._state = True
-        self._position = 100 - (result.data["target_state"]["level"] / 100)
+        if self._moving == "stop" and self.is_opened:
+            return
+        await self._client.set_cover_level_async(self._wiser_id, 0)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
-        self._position = kwargs.get(ATTR_POSITION, 100)
-        result = await self._client.set_cover_level_async(self._wiser_id, 10000)
-        self._state = True
-        self._position = 100 - (result.data["target_state"]["level"] / 100)
+        if self._moving == "stop" and self.is_closed:
+            return
+        await self._client.set_cover_level_async(self._wiser_id, 10000)
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
-        self._position = kwargs.get(ATTR_POSITION, 100)
-        result = await self._client.set_cover_level_async(
-            self._wiser_id, (100 - self._position) * 100
+        position = kwargs.get(ATTR_POSITION, 100)
+        if (
+            self._moving == "stop"
+            and self._position is not None
+            and abs(self._position - position) < 1
+        ):
+            return
+        await self._client.set_cover_level_async(
+            self._wiser_id, (100 - position) * 100
         )
-        self._state = True
-        self._position = 100 - (result.data["target_state"]["level"] / 100)
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         await self._client.send_load_ctrl_event_async(
             self._wiser_id, {"button": "stop", "event": "click"}
         )
 
-    async def async_update(self) -> None:
-        result = await self._client.get_load_async(self._wiser_id)
-
-        # ha: 100 = open, 0 = closed
-        # feller: 10000 = closed, 0 = open
-        self._position = 100 - (result.data["state"]["level"] / 100)
-
-        if result.data["state"]["moving"] == "stop":
-            self._is_closing = False
-            self._is_opening = False
-        if result.data["state"]["moving"] == "up":
-            self._is_closing = False
-            self._is_opening = True
-        if result.data["state"]["moving"] == "down":
-            self._is_closing = True
-            self._is_opening = False
-
-        if self._position >= 100:
-            self._is_closed = False
-            self._is_opened = True
-            self._is_partially_opened = False
-        elif self._position <= 0:
-            self._is_closed = True
-            self._is_opened = False
-            self._is_partially_opened = False
-        else:
-            self._is_closed = False
-            self._is_opened = False
-            self._is_partially_opened = True
-
-    def update_from_websocket_message(self, message):
-        """Updates the cover state from an websocket message."""
-
-        if "load" not in message:
-            _LOGGER.debug(
-                "No load in websocket message, skipping update of cover with id %s",
-                self._id,
-            )
-            return
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Updates the cover state from the latest coordinator data."""
+        data = self.coordinator.data.get(self._wiser_id) or {}
+        self._apply_state(data.get("state"))
 
-        message = message["load"]
+    def _apply_state(self, state: dict | None) -> None:
+        old_state = (self._last_available, self._position, self._moving)
+        self._last_available = self.available
+        if state is not None:
+            self._update_from_state(state)
 
-        if "state" not in message:
-            _LOGGER.debug(
-                "No state in websocket message, skipping update of cover with id %s",
-                self._id,
-            )
+        if old_state == (self._last_available, self._position, self._moving):
             return
 
-        position = message["state"]["level"]
-        moving = message["state"]["moving"]
-
-        self._position = 100 - (position / 100)
-
-        if moving == "stop":
-            self._is_closing = False
-            self._is_opening = False
-        if moving == "up":
-            self._is_closing = False
-            self._is_opening = True
-        if moving == "down":
-            self._is_closing = True
-            self._is_opening = False
-
-        if self._position >= 100:
-            self._is_closed = False
-            self._is_opened = True
-            self._is_partially_opened = False
-        elif self._position <= 0:
-            self._is_closed = True
-            self._is_opened = False
-            self._is_partially_opened = False
-        else:
-            self._is_closed = False
-            self._is_opened = False
-            self._is_partially_opened = True
-
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
+
+    def _update_from_state(self, state: dict) -> None:
+        self._position = _level_to_position(state["level"])
+        self._moving = state["moving"]
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import random
 
 import aiohttp
 
@@ -28,9 +29,15 @@ class FellerApiResult:
 class FellerApiException(Exception):
     """Exception raised when a Feller API request fails."""
 
-    def __init__(self, message: str) -> None:
+    def __init__(self, message: str, status_code: int | None = None) -> None:
         """Exception initialization."""
         super().__init__(message)
+        self._status_code = status_code
+
+    @property
+    def status_code(self) -> int | None:
+        """Get the status code of the failed request, if a response was received."""
+        return self._status_code
 
 
 class FellerApiClient:
@@ -38,32 +45,41 @@ class FellerApiClient:
 
     def __init__(self, host: str, apiKey: str, request_timeout_seconds: int) -> None:
         """Client initialization."""
-        self._host = host
-        self._apiKey = apiKey
         self._request_timeout_seconds = request_timeout_seconds
+        self._headers = {"authorization": f"Bearer {apiKey}"}
+        self._base_url = f"http://{host}/api/"
+        self._session: aiohttp.ClientSession | None = None
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    limit_per_host=10,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self._request_timeout_seconds),
+            )
+        return self._session
 
-    async def get_all_loads_async(self) -> FellerApiResult:
+    async def get_all_loads_async(self, retry_count: int = 3) -> FellerApiResult:
         """Get all loads from the Wiser API."""
-        return await self._send_request_async(endpoint="loads")
-
-    async def get_all_hvac_groups_async(self) -> FellerApiResult:
-        """Get all hvac groups from the Wiser API."""
-        return await self._send_request_async(endpoint="hvacgroups")
-
-    async def get_hvac_group_async(
-        self, group_id: int, retry_count: int = 5
-    ) -> FellerApiResult:
-        """Get an hvac group from the Wiser API."""
         return await self._send_request_with_retry_async(
-            endpoint=f"hvacgroups/{group_id}", retry_count=retry_count
+            endpoint="loads", retry_count=retry_count
         )
 
-    async def get_load_async(
-        self, load_id: int, retry_count: int = 5
-    ) -> FellerApiResult:
-        """Get a load from the Wiser API."""
+    async def get_all_hvac_groups_async(self, retry_count: int = 3) -> FellerApiResult:
+        """Get all hvac groups from the Wiser API."""
         return await self._send_request_with_retry_async(
-            endpoint=f"loads/{load_id}", retry_count=retry_count
+            endpoint="hvacgroups", retry_count=retry_count
         )
 
     async def set_hvac_group_temperature_async(
@@ -126,7 +142,13 @@ class FellerApiClient:
             try:
                 return await self._send_request_async(endpoint, method, data)
             except FellerApiException as e:
-                await asyncio.sleep(i + 1)
+                if e.status_code is not None and e.status_code < 500:
+                    raise
+                if i == retry_count - 1:
+                    raise FellerApiException(
+                        f"Wiser API Request to {endpoint} failed after {retry_count} retries"
+                    ) from e
+                await asyncio.sleep(min(30, (2**i) * 0.5) + random.uniform(0, 0.5))
 
         raise FellerApiException(
             f"Wiser API Request to {endpoint} failed after {retry_count} retries"
@@ -136,21 +158,16 @@ class FellerApiClient:
         self, endpoint: str, method: str = "GET", data: dict | None = None
     ) -> None | FellerApiResult:
         """Send request to Feller Wiser API."""
-        url = f"http://{self._host}/api/{endpoint}"
-        headers = {"authorization": f"Bearer {self._apiKey}"}
+        url = self._base_url + endpoint
 
         _LOGGER.debug("Sending request to %s", url)
         try:
-            async with (
-                aiohttp.ClientSession() as session,
-                session.request(
-                    method,
-                    url,
-                    headers=headers,
-                    json=data,
-                    timeout=self._request_timeout_seconds,
-                ) as response,
-            ):
+            async with self._get_session().request(
+                method,
+                url,
+                headers=self._headers,
+                json=data,
+            ) as response:
                 if response.status >= 400:
                     _LOGGER.error(
                         "Wiser API request to endpoint %s with method %s was unsuccessful: response code %s",
@@ -159,7 +176,8 @@ class FellerApiClient:
                         response.status,
                     )
                     raise FellerApiException(
-                        f"Wiser API Request to {url} failed with status {response.status}"
+                        f"Wiser API Request to {url} failed with status {response.status}",
+                        status_code=response.status,
                     )
                 data = await response.json()
 
@@ -181,9 +199,10 @@ class FellerApiClient:
                     response.status,
                 )
                 raise FellerApiException(
-                    f"Wiser API Request to {url} failed with status {response.status}"
+                    f"Wiser API Request to {url} failed with status {response.status}",
+                    status_code=response.status,
                 )
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             _LOGGER.error(
                 "Wiser API request to endpoint %s with method %s failed: %s",
                 endpoint,
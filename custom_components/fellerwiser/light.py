@@ -6,49 +6,87 @@ import logging
 from typing import Any
 
 from homeassistant.components.light import ATTR_BRIGHTNESS, LightEntity
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import REQUEST_TIMEOUT_SECONDS
+from .const import DOMAIN
+from .coordinator import FellerLoadsCoordinator
 
 # Import the device class from the component that you want to support
 from .feller_client import FellerApiClient, FellerApiException
-from .main import WISER_ENTITIES
+from .main import WebsocketState
 
 _LOGGER = logging.getLogger(__name__)
 
+# ha: 0 - 255, feller: 0 - 10000
+_HA_MAX_BRIGHTNESS = 255
+_WISER_MAX_BRIGHTNESS = 10000
 
-async def async_setup_entry(hass, entry, async_add_entities):
-    host = entry.data["host"]
-    apikey = entry.data["apikey"]
 
-    client = FellerApiClient(host, apikey, REQUEST_TIMEOUT_SECONDS)
-    result = await client.get_all_loads_async()
+def _wiser_to_ha(bri: int) -> int:
+    """Convert a wiser brightness to a home assistant brightness."""
+    if bri <= 0:
+        return 0
+    # keep dimmed but lit loads at a brightness of at least 1
+    return max(
+        1,
+        (bri * _HA_MAX_BRIGHTNESS + _WISER_MAX_BRIGHTNESS // 2)
+        // _WISER_MAX_BRIGHTNESS,
+    )
+
+
+def _ha_to_wiser(bri: int) -> int:
+    """Convert a home assistant brightness to a wiser brightness."""
+    return min(
+        _WISER_MAX_BRIGHTNESS,
+        (bri * _WISER_MAX_BRIGHTNESS + _HA_MAX_BRIGHTNESS // 2) // _HA_MAX_BRIGHTNESS,
+    )
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    data = hass.data[DOMAIN][entry.entry_id]
+    client: FellerApiClient = data["client"]
+    coordinator: FellerLoadsCoordinator = data["loads_coordinator"]
+    websocket: WebsocketState = data["websocket"]
 
     light_entities = []
-    for value in result.data:
+    for value in coordinator.data.values():
         if value["type"] in ["dim", "dali", "onoff"]:
             if value["unused"] == True:
                 continue
-            light_entities.append(FellerLight(value, client))
-
-    WISER_ENTITIES.extend(light_entities)
+            light_entities.append(
+                FellerLight(coordinator, value, client, websocket)
+            )
 
-    async_add_entities(light_entities, True)
+    async_add_entities(light_entities)
 
 
-class FellerLight(LightEntity):
+class FellerLight(CoordinatorEntity[FellerLoadsCoordinator], LightEntity):
     """Representation of an Feller Light."""
 
-    def __init__(self, data, client: FellerApiClient) -> None:
+    def __init__(
+        self,
+        coordinator: FellerLoadsCoordinator,
+        data,
+        client: FellerApiClient,
+        websocket: WebsocketState,
+    ) -> None:
         """Initialize an Feller Light."""
+        super().__init__(coordinator)
         self._name = data["name"]
         self._id = str(data["id"])
         self._wiser_id = data["id"]
         self._attr_unique_id = f"light.{self._id}"
         self._is_on = None
         self._brightness = None
+        self._last_available: bool | None = None
         self._client: FellerApiClient = client
+        self._websocket = websocket
         self._type = data["type"]
 
+        if "state" in data:
+            self._update_from_state(data["state"])
+
     @property
     def name(self) -> str:
         """Return the display name of this light."""
@@ -58,6 +96,21 @@ class FellerLight(LightEntity):
     def wiser_entity_id(self):
         return self._wiser_id
 
+    @property
+    def available(self) -> bool:
+        """Available while the websocket is connected or the last resync succeeded."""
+        return self._websocket.connected or super().available
+
+    async def async_added_to_hass(self) -> None:
+        """Start receiving websocket updates once the entity is added."""
+        await super().async_added_to_hass()
+        self._websocket.load_entities[self._wiser_id] = self
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop receiving websocket updates once the entity is removed."""
+        await super().async_will_remove_from_hass()
+        self._websocket.load_entities.pop(self._wiser_id, None)
+
     @property
     def brightness(self):
         """Return the brightness of the light."""
@@ -68,10 +121,6 @@ class FellerLight(LightEntity):
         """Return true if light is on."""
         return self._is_on
 
-    @property
-    def should_poll(self) -> bool | None:
-        return False
-
     @property
     def color_mode(self) -> str | None:
         if self._type == "onoff":
@@ -95,22 +144,19 @@ class FellerLight(LightEntity):
             await self._client.send_load_ctrl_event_async(
                 load_id=self._wiser_id, body={"button": "on", "event": "click"}
             )
+            # the websocket push reconciles the actual brightness
             self._is_on = True
-            result = await self._client.get_load_async(self._wiser_id)
-            self._brightness = result.data["state"]["bri"] / 39.22
+            self._brightness = self._brightness or 255
+            self.async_write_ha_state()
             return
 
         self._brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
-        convertedBrightness = round(self._brightness * 39.22)
-
-        if convertedBrightness > 10000:
-            convertedBrightness = 10000
-
         result = await self._client.set_light_brightness_async(
-            self._wiser_id, convertedBrightness
+            self._wiser_id, _ha_to_wiser(self._brightness)
         )
         self._is_on = True
-        self._brightness = result.data["target_state"]["bri"] / 39.22
+        self._brightness = _wiser_to_ha(result.data["target_state"]["bri"])
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Instruct the light to turn off."""
@@ -119,76 +165,44 @@ class FellerLight(LightEntity):
             load_id=self._wiser_id, body={"button": "off", "event": "click"}
         )
         self._is_on = False
-        result = await self._client.get_load_async(self._wiser_id)
-        self._brightness = result.data["state"]["bri"] / 39.22
-
-    async def async_update(self) -> None:
-        """Fetches the current state of the ligth."""
-
-        result = await self._client.get_load_async(self._wiser_id)
-
-        _LOGGER.debug("Got the following state for light %s: %s", self._id, result.data)
-
-        if "state" not in result.data:
-            _LOGGER.debug("No state in update response for light %s", self._id)
+        self._brightness = 0
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Updates the light from the latest coordinator data."""
+        data = self.coordinator.data.get(self._wiser_id) or {}
+        self._apply_state(data.get("state"))
+
+    def _apply_state(self, state: dict | None) -> None:
+        old_state = (self._last_available, self._brightness, self._is_on)
+        self._last_available = self.available
+        if state is not None:
+            self._update_from_state(state)
+
+        if old_state == (self._last_available, self._brightness, self._is_on):
             return
 
-        if result.data["state"]["bri"] is None:
-            self._brightness = 0
-            self._is_on = False
-            return
-
-        if result.data["state"]["bri"] > 0:
-            self._is_on = True
-        else:
-            self._is_on = False
-        self._brightness = result.data["state"]["bri"] / 39.22
-
-    def update_from_websocket_message(self, message):
-        """Updates the ligth from an websocket message."""
-
-        if "load" not in message:
-            _LOGGER.debug(
-                "No load in websocket message, skipping update of light with id %s",
-                self._id,
-            )
-            return
-
-        message = message["load"]
-
-        if "state" not in message:
-            _LOGGER.debug(
-                "No state in websocket message, skipping update of light with id %s",
-                self._id,
-            )
-            return
+        self.async_write_ha_state()
 
+    def _update_from_state(self, state: dict) -> None:
         try:
-            if message["state"]["flags"]["fading"] == 1:
+            if state["flags"]["fading"] == 1:
                 # Skip update since light is in fading updateExternal
                 return
         except KeyError:
             pass
 
-        if "bri" not in message["state"]:
+        if "bri" not in state:
             _LOGGER.debug(
-                "No bri in websocket message, skipping update of light with id %s",
+                "No bri in state, skipping update of light with id %s",
                 self._id,
             )
             return
 
-        if message["state"]["bri"] is None:
+        if not state["bri"]:
             self._brightness = 0
             self._is_on = False
-            self.schedule_update_ha_state()
-            return
-
-        if message["state"]["bri"] == 0:
-            self._is_on = False
-            self._brightness = 0
-            self.schedule_update_ha_state()
-            return
-
-        self._brightness = message["state"]["bri"] / 39.22
-        self._is_on = True
-        self.schedule_update_ha_state()
+        else:
+            self._brightness = _wiser_to_ha(state["bri"])
+            self._is_on = True
@@ -3,18 +3,36 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import socket
+from typing import Any
 
 import websockets
 
+from homeassistant.util.json import json_loads
+
 _LOGGER = logging.getLogger(__name__)
 
-WISER_ENTITIES = []
 
+class WebsocketState:
+    """Entities and connection state of the websocket of one config entry."""
+
+    def __init__(self) -> None:
+        """State initialization."""
+        self.connected = False
+        self.load_entities: dict[int, Any] = {}
+        self.hvac_entities: dict[int, Any] = {}
+
+    def set_connected(self, connected: bool) -> None:
+        """Update the connection state and the availability of all entities."""
+        if connected == self.connected:
+            return
+        self.connected = connected
+        for entity in (*self.load_entities.values(), *self.hvac_entities.values()):
+            entity._apply_state(None)
 
-async def establish_websocket(host, apikey):
+
+async def establish_websocket(host, apikey, websocket: WebsocketState):
     """Establishes a websocket connection to the Wiser API and updates entities based on the messages received."""
 
     while True:
@@ -25,8 +43,11 @@ async def establish_websocket(host, apikey):
                 additional_headers={"authorization": "Bearer " + apikey},
                 ping_timeout=None,
             ) as ws:
-                while True:
-                    await _handle_websocket_message(ws)
+                websocket.set_connected(True)
+                try:
+                    await _run_websocket(ws, websocket)
+                finally:
+                    websocket.set_connected(False)
 
         except socket.gaierror:
             _LOGGER.error("Websocket connection error, retrying in 10 sec")
@@ -36,53 +57,102 @@ async def establish_websocket(host, apikey):
             _LOGGER.error("Configured host refused connection, retrying in 10 sec")
             await asyncio.sleep(10)
             continue
+        except websockets.exceptions.ConnectionClosed:
+            # the ping fallback already waited before giving up on the connection
+            _LOGGER.info("Websocket connection lost, reconnecting")
+            continue
+        except OSError as e:
+            _LOGGER.error("Websocket connection error, retrying in 10 sec: %s", e)
+            await asyncio.sleep(10)
+            continue
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             _LOGGER.error("Unhadled Exception occured in WebSocket loop: %s", e)
             continue
 
 
-async def _handle_websocket_message(ws):
+async def _run_websocket(ws, websocket: WebsocketState) -> None:
+    """Runs the reader and the worker of a connection until one of them stops."""
+    queue: asyncio.Queue[str | bytes] = asyncio.Queue(maxsize=256)
+    tasks = (
+        asyncio.create_task(_read_websocket_messages(ws, queue)),
+        asyncio.create_task(_process_websocket_messages(queue, websocket)),
+    )
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task in done:
+        task.result()
+
+
+async def _read_websocket_messages(ws, queue: asyncio.Queue) -> None:
+    """Receives raw frames from the websocket and queues them for processing."""
+    while True:
+        result = await _receive_websocket_message(ws)
+        if result is not None:
+            await queue.put(result)
+
+
+async def _process_websocket_messages(
+    queue: asyncio.Queue, websocket: WebsocketState
+) -> None:
+    """Parses queued frames and dispatches them to the entities."""
+    while True:
+        result = await queue.get()
+        _handle_websocket_message(result, websocket)
+
+
+async def _receive_websocket_message(ws) -> str | bytes | None:
     try:
         result = await asyncio.wait_for(ws.recv(), timeout=None)
     except (TimeoutError, websockets.exceptions.ConnectionClosed):
         try:
             pong = await ws.ping()
-            await asyncio.wait_for(pong, timeout=None)
+            await asyncio.wait_for(pong, timeout=10)
             _LOGGER.info("Ping OK, keeping connection alive")
-        except:
+        except (
+            OSError,
+            websockets.exceptions.ConnectionClosed,
+            asyncio.TimeoutError,
+        ):
             _LOGGER.info("Ping error - retrying connection in 10 sec (Ctrl-C to quit)")
             await asyncio.sleep(10)
-            return
-    _LOGGER.debug("Reveived the following message form wiser: %s", result)
-    message = json.loads(result)
+            raise
+        return None
+    return result
 
-    wiser_entity_id = _get_wiser_entity_id(message)
 
-    if wiser_entity_id is None:
-        return
+def _handle_websocket_message(result: str | bytes, websocket: WebsocketState) -> None:
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Reveived the following message form wiser: %s", result)
+    message = json_loads(result)
 
-    entity = [e for e in WISER_ENTITIES if e.wiser_entity_id == wiser_entity_id]
+    if "load" in message:
+        message = message["load"]
+        entities = websocket.load_entities
+    elif "hvacgroup" in message:
+        message = message["hvacgroup"]
+        entities = websocket.hvac_entities
+    else:
+        return
 
-    if entity == []:
-        _LOGGER.debug("No entity found for id %s", wiser_entity_id)
+    if "id" not in message:
+        _LOGGER.debug("No id in websocket message, ignoring")
         return
 
-    entity = entity[0]
+    entity = entities.get(message["id"])
 
-    entity.update_from_websocket_message(message)
+    if entity is None:
+        _LOGGER.debug("No entity found for id %s", message["id"])
+        return
 
+    if "state" not in message:
+        _LOGGER.debug("No state in websocket message for id %s", message["id"])
+        return
 
-def _get_wiser_entity_id(message) -> str | None:
-    if "load" in message:
-        if "id" not in message["load"]:
-            _LOGGER.debug("No id in websocket message for load, ignoring")
-            return None
-        return message["load"]["id"]
-
-    if "hvacgroup" in message:
-        if "id" not in message["hvacgroup"]:
-            _LOGGER.debug("No id in websocket message for hvacgroup, ignoring")
-            return None
-        return message["hvacgroup"]["id"]
-
-    return None
+    entity._apply_state(message["state"])